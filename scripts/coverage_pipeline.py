@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""Verify 100% test coverage and update the README badge in a single pass."""
+
+import sys
+
+from check_coverage import measure_coverage, verify_coverage
+from coverage.results import display_covered
+from update_coverage_badge import update_readme_badge
+
+
+def run_pipeline() -> bool:
+    """Run the tests under coverage once, then check it and update the badge.
+
+    Returns:
+        True if coverage is 100%, False otherwise.
+    """
+    percent = measure_coverage()
+
+    if percent is not None:
+        # round like the TOTAL line of the report printed above
+        update_readme_badge(int(display_covered(percent, 0)))
+
+    return verify_coverage(percent)
+
+
+if __name__ == "__main__":
+    success = run_pipeline()
+    sys.exit(0 if success else 1)
@@ -1,39 +1,35 @@
 #!/usr/bin/env python3
 """Generate coverage badge for README."""
 
+import io
 import re
-import subprocess
+
+from coverage import Coverage, CoverageException
+
+_BADGE_RE = re.compile(
+    r"\[!\[Coverage\]\(https://img\.shields\.io/badge/coverage-\d+%25-\w+\.svg\)\]"
+)
 
 
 def get_coverage_percentage() -> int:
     """Get the current coverage percentage.
 
+    Reads the stored `.coverage` data through the coverage API.
+
     Returns:
         Coverage percentage as integer.
     """
-    try:
-        # run coverage report
-        result = subprocess.run(
-            ["python", "-m", "coverage", "report"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        # extract total coverage percentage
-        lines = result.stdout.strip().split("\n")
-        total_line = [line for line in lines if line.startswith("TOTAL")]
-
-        if total_line:
-            # extract percentage from "TOTAL    109      0   100%"
-            match = re.search(r"(\d+)%", total_line[0])
-            if match:
-                return int(match.group(1))
+    cov = Coverage()
+    buf = io.StringIO()
 
+    try:
+        cov.load()
+        # only render the total, rounded the same way as `coverage report`
+        cov.report(file=buf, output_format="total")
+    except CoverageException:
         return 0
 
-    except subprocess.CalledProcessError:
-        return 0
+    return int(buf.getvalue())
 
 
 def update_readme_badge(coverage: int) -> None:
@@ -42,28 +38,32 @@ def update_readme_badge(coverage: int) -> None:
     Args:
         coverage: Coverage percentage.
     """
-    try:
-        with open("README.md") as f:
-            content = f.read()
+    # determine badge color based on coverage
+    if coverage >= 95:
+        color = "brightgreen"
+    elif coverage >= 80:
+        color = "green"
+    elif coverage >= 70:
+        color = "yellow"
+    else:
+        color = "red"
 
-        # determine badge color based on coverage
-        if coverage >= 95:
-            color = "brightgreen"
-        elif coverage >= 80:
-            color = "green"
-        elif coverage >= 70:
-            color = "yellow"
-        else:
-            color = "red"
+    new_badge = f"[![Coverage](https://img.shields.io/badge/coverage-{coverage}%25-{color}.svg)]"
 
-        # Update badge
-        badge_pattern = r"\[!\[Coverage\]\(https://img\.shields\.io/badge/coverage-\d+%25-\w+\.svg\)\]"
-        new_badge = f"[![Coverage](https://img.shields.io/badge/coverage-{coverage}%25-{color}.svg)]"
+    try:
+        # read and rewrite through a single file handle
+        with open("README.md", "r+") as f:
+            content = f.read()
+            updated_content = _BADGE_RE.sub(new_badge, content)
 
-        updated_content = re.sub(badge_pattern, new_badge, content)
+            # skip the write when the badge is already up to date
+            if updated_content == content:
+                print(f"✅ README badge unchanged: {coverage}% coverage ({color})")
+                return
 
-        with open("README.md", "w") as f:
+            f.seek(0)
             f.write(updated_content)
+            f.truncate()
 
         print(f"✅ Updated README badge: {coverage}% coverage ({color})")
 
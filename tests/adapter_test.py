@@ -1,6 +1,10 @@
 """Comprehensive tests for AsyncRestAdapter module."""
 
-import json
+import asyncio
+from collections.abc import Iterator
+from json import JSONDecodeError
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
@@ -15,10 +19,94 @@ from sdk_creator.errors import (
     ApiTimeoutError,
 )
 
+_JSON_DECODE_ERR = JSONDecodeError("Invalid JSON", "", 0)
+_LARGE_JSON_DATA = {"data": [{"id": i, "name": f"User {i}"} for i in range(1000)]}
+
+
+def _response(
+    status_code: int, reason_phrase: str, json_data: Any, text: str
+) -> SimpleNamespace:
+    """Create a lightweight stand-in for `httpx.Response`."""
+    return SimpleNamespace(
+        status_code=status_code,
+        is_success=200 <= status_code < 300,
+        reason_phrase=reason_phrase,
+        text=text,
+        json=lambda: json_data,
+    )
+
+
+def _ok_response(json_data: Any = None, text: str = "success") -> SimpleNamespace:
+    """Create a successful response, defaulting to `{"result": "success"}`."""
+    if json_data is None:
+        json_data = {"result": "success"}
+    return _response(200, "OK", json_data, text)
+
+
+def _err_response(
+    status_code: int = 404,
+    reason_phrase: str = "Not Found",
+    json_data: Any = None,
+    text: str = "Not found",
+) -> SimpleNamespace:
+    """Create an error response, defaulting to `{"error": "Not found"}`."""
+    if json_data is None:
+        json_data = {"error": "Not found"}
+    return _response(status_code, reason_phrase, json_data, text)
+
+
+class _FakeClient:
+    """Minimal stand-in for `httpx.AsyncClient` that records `aclose` calls."""
+
+    def __init__(self) -> None:
+        self.aclose_calls = 0
+
+    async def aclose(self) -> None:
+        self.aclose_calls += 1
+
+
+@pytest.fixture(scope="module")
+def adapter() -> Iterator[AsyncRestAdapter]:
+    """Create adapter instance shared by the tests of this module."""
+    adapter = AsyncRestAdapter("api.example.com")
+    # installed once; tests configure it through the `client_request` fixture
+    adapter._client.request = AsyncMock()
+    yield adapter
+    asyncio.run(adapter.close())
+
+
+@pytest.fixture
+def client_request(adapter: AsyncRestAdapter) -> AsyncMock:
+    """Return the adapter's shared `request` mock, reset for the current test."""
+    request = adapter._client.request
+    assert isinstance(request, AsyncMock)
+    request.reset_mock(return_value=True, side_effect=True)
+    return request
+
+
+# module-scoped responses are shared between tests and must not be mutated
+@pytest.fixture(scope="module")
+def mock_response() -> SimpleNamespace:
+    """Create mock HTTP response."""
+    return _ok_response()
+
+
+@pytest.fixture(scope="module")
+def mock_error_response() -> SimpleNamespace:
+    """Create mock HTTP error response."""
+    return _err_response()
+
 
 class TestAsyncRestAdapterInit:
     """Test AsyncRestAdapter initialization."""
 
+    @pytest.fixture(autouse=True)
+    def mock_client(self, monkeypatch: pytest.MonkeyPatch) -> Mock:
+        """Replace `httpx.AsyncClient` so the client constructor can be inspected."""
+        mock_client = Mock()
+        monkeypatch.setattr("httpx.AsyncClient", mock_client)
+        return mock_client
+
     def test_init_minimal(self) -> None:
         """Test initialization with minimal required parameters."""
         adapter = AsyncRestAdapter("api.example.com")
@@ -41,46 +129,41 @@ class TestAsyncRestAdapterInit:
         )
         assert str(adapter.base_url) == "https://api.example.com/v1/users"
 
-    def test_init_with_api_key(self) -> None:
+    def test_init_with_api_key(self, mock_client: Mock) -> None:
         """Test initialization with API key."""
-        with patch("httpx.AsyncClient") as mock_client:
-            AsyncRestAdapter("api.example.com", api_key="test-key")
-            mock_client.assert_called_once()
-            call_kwargs = mock_client.call_args[1]
-            assert call_kwargs["headers"]["x-api-key"] == "test-key"
+        AsyncRestAdapter("api.example.com", api_key="test-key")
+        mock_client.assert_called_once()
+        call_kwargs = mock_client.call_args[1]
+        assert call_kwargs["headers"]["x-api-key"] == "test-key"
 
-    def test_init_with_azure_api(self) -> None:
+    def test_init_with_azure_api(self, mock_client: Mock) -> None:
         """Test initialization with Azure API configuration."""
-        with patch("httpx.AsyncClient") as mock_client:
-            AsyncRestAdapter("api.example.com", api_key="azure-key", azure_api=True)
-            mock_client.assert_called_once()
-            call_kwargs = mock_client.call_args[1]
-            assert call_kwargs["headers"]["Ocp-Apim-Subscription-Key"] == "azure-key"
+        AsyncRestAdapter("api.example.com", api_key="azure-key", azure_api=True)
+        mock_client.assert_called_once()
+        call_kwargs = mock_client.call_args[1]
+        assert call_kwargs["headers"]["Ocp-Apim-Subscription-Key"] == "azure-key"
 
-    def test_init_with_jwt_token(self) -> None:
+    def test_init_with_jwt_token(self, mock_client: Mock) -> None:
         """Test initialization with JWT token."""
-        with patch("httpx.AsyncClient") as mock_client:
-            AsyncRestAdapter("api.example.com", jwt_token="jwt-token")
-            mock_client.assert_called_once()
-            call_kwargs = mock_client.call_args[1]
-            assert call_kwargs["headers"]["Authorization"] == "Bearer jwt-token"
+        AsyncRestAdapter("api.example.com", jwt_token="jwt-token")
+        mock_client.assert_called_once()
+        call_kwargs = mock_client.call_args[1]
+        assert call_kwargs["headers"]["Authorization"] == "Bearer jwt-token"
 
-    def test_init_with_custom_headers(self) -> None:
+    def test_init_with_custom_headers(self, mock_client: Mock) -> None:
         """Test initialization with custom headers."""
         custom_headers = {"Custom-Header": "custom-value"}
-        with patch("httpx.AsyncClient") as mock_client:
-            AsyncRestAdapter("api.example.com", headers=custom_headers)
-            mock_client.assert_called_once()
-            call_kwargs = mock_client.call_args[1]
-            assert call_kwargs["headers"]["Custom-Header"] == "custom-value"
+        AsyncRestAdapter("api.example.com", headers=custom_headers)
+        mock_client.assert_called_once()
+        call_kwargs = mock_client.call_args[1]
+        assert call_kwargs["headers"]["Custom-Header"] == "custom-value"
 
-    def test_init_ssl_verify_false(self) -> None:
+    def test_init_ssl_verify_false(self, mock_client: Mock) -> None:
         """Test initialization with SSL verification disabled."""
-        with patch("httpx.AsyncClient") as mock_client:
-            AsyncRestAdapter("api.example.com", ssl_verify=False)
-            mock_client.assert_called_once()
-            call_kwargs = mock_client.call_args[1]
-            assert call_kwargs["verify"] is False
+        AsyncRestAdapter("api.example.com", ssl_verify=False)
+        mock_client.assert_called_once()
+        call_kwargs = mock_client.call_args[1]
+        assert call_kwargs["verify"] is False
 
     def test_init_empty_hostname_raises_error(self) -> None:
         """Test that empty hostname raises ValueError."""
@@ -96,331 +179,227 @@ class TestAsyncRestAdapterInit:
 class TestAsyncRestAdapterHttpMethods:
     """Test HTTP method implementations."""
 
-    @pytest.fixture
-    def adapter(self) -> AsyncRestAdapter:
-        """Create adapter instance for testing."""
-        return AsyncRestAdapter("api.example.com")
-
-    @pytest.fixture
-    def mock_response(self) -> Mock:
-        """Create mock HTTP response."""
-        response = Mock()
-        response.status_code = 200
-        response.is_success = True
-        response.reason_phrase = "OK"
-        response.json.return_value = {"result": "success"}
-        response.text = "success"
-        return response
-
-    @pytest.fixture
-    def mock_error_response(self) -> Mock:
-        """Create mock HTTP error response."""
-        response = Mock()
-        response.status_code = 404
-        response.is_success = False
-        response.reason_phrase = "Not Found"
-        response.json.return_value = {"error": "Not found"}
-        response.text = "Not found"
-        return response
-
+    @pytest.mark.parametrize(
+        ("method", "endpoint", "data", "expected_data"),
+        [
+            ("get", "users", None, {"result": "success"}),
+            (
+                "post",
+                "users",
+                {"name": "John", "email": "john@example.com"},
+                {"result": "success"},
+            ),
+            (
+                "put",
+                "users/123",
+                {"name": "John Updated", "email": "john.updated@example.com"},
+                "success",
+            ),
+            ("patch", "users/123", {"name": "John Patched"}, "success"),
+            ("delete", "users/123", None, "success"),
+            ("delete", "users/123", {"reason": "Spam account"}, "success"),
+        ],
+        ids=["get", "post", "put", "patch", "delete", "delete-with-data"],
+    )
     @pytest.mark.asyncio
-    async def test_get_request(
-        self, adapter: AsyncRestAdapter, mock_response: Mock
+    async def test_http_method(
+        self,
+        adapter: AsyncRestAdapter,
+        client_request: AsyncMock,
+        mock_response: SimpleNamespace,
+        method: str,
+        endpoint: str,
+        data: dict[str, str] | None,
+        expected_data: Any,
     ) -> None:
-        """Test GET request."""
-        with patch.object(adapter._client, "request", return_value=mock_response):
-            result = await adapter.get("users")
+        """Test each HTTP method sends the request and wraps the response."""
+        send = getattr(adapter, method)
 
-            assert result.status_code == 200
-            assert result.data == {"result": "success"}
-            assert result.message == "OK"
+        client_request.return_value = mock_response
 
-            adapter._client.request.assert_called_once_with(
-                "GET",
-                "users",
-                timeout=None,
-                headers=None,
-                params={},
-                json=None,
-            )
+        result = await (send(endpoint, data=data) if data else send(endpoint))
+
+        assert result.status_code == 200
+        assert result.data == expected_data
+        assert result.message == "OK"
+
+        client_request.assert_called_once_with(
+            method.upper(),
+            endpoint,
+            timeout=None,
+            headers=None,
+            params={},
+            json=data,
+        )
 
     @pytest.mark.asyncio
     async def test_get_request_with_params(
-        self, adapter: AsyncRestAdapter, mock_response: Mock
+        self,
+        adapter: AsyncRestAdapter,
+        client_request: AsyncMock,
+        mock_response: SimpleNamespace,
     ) -> None:
         """Test GET request with query parameters."""
-        with patch.object(adapter._client, "request", return_value=mock_response):
-            await adapter.get("users", page=1, limit=10)
+        client_request.return_value = mock_response
 
-            adapter._client.request.assert_called_once_with(
-                "GET",
-                "users",
-                timeout=None,
-                headers=None,
-                params={"page": 1, "limit": 10},
-                json=None,
-            )
+        await adapter.get("users", page=1, limit=10)
+
+        client_request.assert_called_once_with(
+            "GET",
+            "users",
+            timeout=None,
+            headers=None,
+            params={"page": 1, "limit": 10},
+            json=None,
+        )
 
     @pytest.mark.asyncio
     async def test_get_request_expect_text_response(
-        self, adapter: AsyncRestAdapter, mock_response: Mock
+        self,
+        adapter: AsyncRestAdapter,
+        client_request: AsyncMock,
+        mock_response: SimpleNamespace,
     ) -> None:
         """Test GET request expecting text response."""
-        with patch.object(adapter._client, "request", return_value=mock_response):
-            result = await adapter.get("users", expect_json_response=False)
-
-            assert result.status_code == 200
-            assert result.data == "success"
-            assert result.message == "OK"
-
-    @pytest.mark.asyncio
-    async def test_post_request(
-        self, adapter: AsyncRestAdapter, mock_response: Mock
-    ) -> None:
-        """Test POST request."""
-        data = {"name": "John", "email": "john@example.com"}
+        client_request.return_value = mock_response
 
-        with patch.object(adapter._client, "request", return_value=mock_response):
-            result = await adapter.post("users", data=data, expect_json_response=False)
+        result = await adapter.get("users", expect_json_response=False)
 
-            assert result.status_code == 200
-            assert result.data == "success"
-            assert result.message == "OK"
-
-            adapter._client.request.assert_called_once_with(
-                "POST",
-                "users",
-                timeout=None,
-                headers=None,
-                params={},
-                json=data,
-            )
+        assert result.status_code == 200
+        assert result.data == "success"
+        assert result.message == "OK"
 
     @pytest.mark.asyncio
     async def test_post_request_expect_json(
-        self, adapter: AsyncRestAdapter, mock_response: Mock
+        self,
+        adapter: AsyncRestAdapter,
+        client_request: AsyncMock,
+        mock_response: SimpleNamespace,
     ) -> None:
         """Test POST request expecting JSON response."""
         data = {"name": "John", "email": "john@example.com"}
 
-        with patch.object(adapter._client, "request", return_value=mock_response):
-            result = await adapter.post("users", data=data, expect_json_response=True)
-
-            assert result.status_code == 200
-            assert result.data == {"result": "success"}
-            assert result.message == "OK"
-
-    @pytest.mark.asyncio
-    async def test_put_request(
-        self, adapter: AsyncRestAdapter, mock_response: Mock
-    ) -> None:
-        """Test PUT request."""
-        data = {"name": "John Updated", "email": "john.updated@example.com"}
-
-        with patch.object(adapter._client, "request", return_value=mock_response):
-            result = await adapter.put("users/123", data=data)
-
-            assert result.status_code == 200
-            assert result.data == "success"
-            assert result.message == "OK"
-
-            adapter._client.request.assert_called_once_with(
-                "PUT",
-                "users/123",
-                timeout=None,
-                headers=None,
-                params={},
-                json=data,
-            )
-
-    @pytest.mark.asyncio
-    async def test_patch_request(
-        self, adapter: AsyncRestAdapter, mock_response: Mock
-    ) -> None:
-        """Test PATCH request."""
-        data = {"name": "John Patched"}
-
-        with patch.object(adapter._client, "request", return_value=mock_response):
-            result = await adapter.patch("users/123", data=data)
+        client_request.return_value = mock_response
 
-            assert result.status_code == 200
-            assert result.data == "success"
-            assert result.message == "OK"
+        result = await adapter.post("users", data=data, expect_json_response=True)
 
-            adapter._client.request.assert_called_once_with(
-                "PATCH",
-                "users/123",
-                timeout=None,
-                headers=None,
-                params={},
-                json=data,
-            )
-
-    @pytest.mark.asyncio
-    async def test_delete_request(
-        self, adapter: AsyncRestAdapter, mock_response: Mock
-    ) -> None:
-        """Test DELETE request."""
-        with patch.object(adapter._client, "request", return_value=mock_response):
-            result = await adapter.delete("users/123")
-
-            assert result.status_code == 200
-            assert result.data == "success"
-            assert result.message == "OK"
-
-            adapter._client.request.assert_called_once_with(
-                "DELETE",
-                "users/123",
-                timeout=None,
-                headers=None,
-                params={},
-                json=None,
-            )
-
-    @pytest.mark.asyncio
-    async def test_delete_request_with_data(
-        self, adapter: AsyncRestAdapter, mock_response: Mock
-    ) -> None:
-        """Test DELETE request with data."""
-        data = {"reason": "Spam account"}
-
-        with patch.object(adapter._client, "request", return_value=mock_response):
-            await adapter.delete("users/123", data=data)
-
-            adapter._client.request.assert_called_once_with(
-                "DELETE",
-                "users/123",
-                timeout=None,
-                headers=None,
-                params={},
-                json=data,
-            )
+        assert result.status_code == 200
+        assert result.data == {"result": "success"}
+        assert result.message == "OK"
 
     @pytest.mark.asyncio
     async def test_request_with_custom_headers(
-        self, adapter: AsyncRestAdapter, mock_response: Mock
+        self,
+        adapter: AsyncRestAdapter,
+        client_request: AsyncMock,
+        mock_response: SimpleNamespace,
     ) -> None:
         """Test request with custom headers."""
         custom_headers = {"X-Custom-Header": "custom-value"}
 
-        with patch.object(adapter._client, "request", return_value=mock_response):
-            await adapter.get("users", headers=custom_headers)
+        client_request.return_value = mock_response
 
-            adapter._client.request.assert_called_once_with(
-                "GET",
-                "users",
-                timeout=None,
-                headers=custom_headers,
-                params={},
-                json=None,
-            )
+        await adapter.get("users", headers=custom_headers)
+
+        client_request.assert_called_once_with(
+            "GET",
+            "users",
+            timeout=None,
+            headers=custom_headers,
+            params={},
+            json=None,
+        )
 
     @pytest.mark.asyncio
     async def test_request_with_timeout(
-        self, adapter: AsyncRestAdapter, mock_response: Mock
+        self,
+        adapter: AsyncRestAdapter,
+        client_request: AsyncMock,
+        mock_response: SimpleNamespace,
     ) -> None:
         """Test request with timeout."""
-        with patch.object(adapter._client, "request", return_value=mock_response):
-            await adapter.get("users", timeout=30.0)
+        client_request.return_value = mock_response
 
-            adapter._client.request.assert_called_once_with(
-                "GET",
-                "users",
-                timeout=30.0,
-                headers=None,
-                params={},
-                json=None,
-            )
+        await adapter.get("users", timeout=30.0)
+
+        client_request.assert_called_once_with(
+            "GET",
+            "users",
+            timeout=30.0,
+            headers=None,
+            params={},
+            json=None,
+        )
 
 
 class TestAsyncRestAdapterErrorHandling:
     """Test error handling in AsyncRestAdapter."""
 
-    @pytest.fixture
-    def adapter(self) -> AsyncRestAdapter:
-        """Create adapter instance for testing."""
-        return AsyncRestAdapter("api.example.com")
-
     @pytest.mark.asyncio
-    async def test_timeout_error(self, adapter: AsyncRestAdapter) -> None:
+    async def test_timeout_error(
+        self, adapter: AsyncRestAdapter, client_request: AsyncMock
+    ) -> None:
         """Test handling of timeout errors."""
-        with (
-            patch.object(
-                adapter._client,
-                "request",
-                side_effect=httpx.TimeoutException("Request timed out"),
-            ),
-            pytest.raises(ApiTimeoutError, match="Request timed out"),
-        ):
+        client_request.side_effect = httpx.TimeoutException("Request timed out")
+
+        with pytest.raises(ApiTimeoutError, match="Request timed out"):
             await adapter.get("users")
 
     @pytest.mark.asyncio
-    async def test_request_error(self, adapter: AsyncRestAdapter) -> None:
+    async def test_request_error(
+        self, adapter: AsyncRestAdapter, client_request: AsyncMock
+    ) -> None:
         """Test handling of request errors."""
-        with (
-            patch.object(
-                adapter._client,
-                "request",
-                side_effect=httpx.ConnectError("Connection failed"),
-            ),
-            pytest.raises(ApiRequestError, match="Request failed"),
-        ):
+        client_request.side_effect = httpx.ConnectError("Connection failed")
+
+        with pytest.raises(ApiRequestError, match="Request failed"):
             await adapter.get("users")
 
     @pytest.mark.asyncio
-    async def test_json_decode_error(self, adapter: AsyncRestAdapter) -> None:
+    async def test_json_decode_error(
+        self, adapter: AsyncRestAdapter, client_request: AsyncMock
+    ) -> None:
         """Test handling of JSON decode errors."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.is_success = True
-        mock_response.reason_phrase = "OK"
-        mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-        mock_response.text = "Invalid JSON response"
-
-        with (
-            patch.object(adapter._client, "request", return_value=mock_response),
-            pytest.raises(ApiResponseError, match="Bad JSON in response"),
-        ):
+        mock_response = _ok_response(text="Invalid JSON response")
+        mock_response.json = Mock(side_effect=_JSON_DECODE_ERR)
+
+        client_request.return_value = mock_response
+
+        with pytest.raises(ApiResponseError, match="Bad JSON in response"):
             await adapter.get("users")
 
     @pytest.mark.asyncio
     async def test_http_error_status_raises_exception(
-        self, adapter: AsyncRestAdapter
+        self,
+        adapter: AsyncRestAdapter,
+        client_request: AsyncMock,
+        mock_error_response: SimpleNamespace,
     ) -> None:
         """Test that HTTP error status raises exception by default."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.is_success = False
-        mock_response.reason_phrase = "Not Found"
-        mock_response.json.return_value = {"error": "Not found"}
-        mock_response.text = "Not found"
+        client_request.return_value = mock_error_response
 
-        with patch.object(adapter._client, "request", return_value=mock_response):
-            with pytest.raises(ApiRaisedFromStatusError) as exc_info:
-                await adapter.get("users")
+        with pytest.raises(ApiRaisedFromStatusError) as exc_info:
+            await adapter.get("users")
 
-            assert exc_info.value.status_code == 404
-            assert "404: Not Found" in str(exc_info.value)
+        assert exc_info.value.status_code == 404
+        assert "404: Not Found" in str(exc_info.value)
 
     @pytest.mark.asyncio
     async def test_http_error_status_graceful_handling(
-        self, adapter: AsyncRestAdapter
+        self,
+        adapter: AsyncRestAdapter,
+        client_request: AsyncMock,
+        mock_error_response: SimpleNamespace,
     ) -> None:
         """Test graceful handling of HTTP error status."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.is_success = False
-        mock_response.reason_phrase = "Not Found"
-        mock_response.json.return_value = {"error": "Not found"}
-        mock_response.text = "Not found"
+        client_request.return_value = mock_error_response
 
-        with patch.object(adapter._client, "request", return_value=mock_response):
-            # use private _request method to test graceful parameter
-            result = await adapter._request("GET", "users", graceful=True)
+        # use private _request method to test graceful parameter
+        result = await adapter._request("GET", "users", graceful=True)
 
-            assert result.status_code == 404
-            assert result.data == {"error": "Not found"}
-            assert result.message == "Not Found"
+        assert result.status_code == 404
+        assert result.data == {"error": "Not found"}
+        assert result.message == "Not Found"
 
 
 class TestAsyncRestAdapterContextManager:
@@ -430,7 +409,7 @@ class TestAsyncRestAdapterContextManager:
     async def test_context_manager_usage(self) -> None:
         """Test using adapter as async context manager."""
         with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
+            mock_client = _FakeClient()
             mock_client_class.return_value = mock_client
 
             async with AsyncRestAdapter("api.example.com") as adapter:
@@ -438,44 +417,34 @@ class TestAsyncRestAdapterContextManager:
                 assert isinstance(adapter, AsyncRestAdapter)
 
             # verify that aclose was called
-            mock_client.aclose.assert_called_once()
+            assert mock_client.aclose_calls == 1
 
     @pytest.mark.asyncio
     async def test_close_method(self) -> None:
         """Test explicit close method."""
         with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
+            mock_client = _FakeClient()
             mock_client_class.return_value = mock_client
 
             adapter = AsyncRestAdapter("api.example.com")
             await adapter.close()
 
             # verify that aclose was called
-            mock_client.aclose.assert_called_once()
+            assert mock_client.aclose_calls == 1
 
 
 class TestAsyncRestAdapterUrlBuilding:
     """Test URL building logic."""
 
-    @pytest.fixture
-    def adapter(self) -> AsyncRestAdapter:
-        """Create adapter instance for testing."""
-        return AsyncRestAdapter("api.example.com")
-
     @pytest.mark.asyncio
-    async def test_url_building_with_params(self, adapter: AsyncRestAdapter) -> None:
+    async def test_url_building_with_params(
+        self, adapter: AsyncRestAdapter, client_request: AsyncMock
+    ) -> None:
         """Test URL building with query parameters."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.is_success = True
-        mock_response.reason_phrase = "OK"
-        mock_response.json.return_value = {"result": "success"}
-
-        with (
-            patch.object(adapter._client, "request", return_value=mock_response),
-            # mock the URL building to verify the correct URL is constructed
-            patch("pydantic.HttpUrl.build") as mock_url_build,
-        ):
+        client_request.return_value = _ok_response()
+
+        # mock the URL building to verify the correct URL is constructed
+        with patch("pydantic.HttpUrl.build") as mock_url_build:
             mock_url_build.return_value = HttpUrl(
                 "https://api.example.com/v1/users?page=1&limit=10"
             )
@@ -486,18 +455,13 @@ class TestAsyncRestAdapterUrlBuilding:
             mock_url_build.assert_called()
 
     @pytest.mark.asyncio
-    async def test_url_building_without_params(self, adapter: AsyncRestAdapter) -> None:
+    async def test_url_building_without_params(
+        self, adapter: AsyncRestAdapter, client_request: AsyncMock
+    ) -> None:
         """Test URL building without query parameters."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.is_success = True
-        mock_response.reason_phrase = "OK"
-        mock_response.json.return_value = {"result": "success"}
-
-        with (
-            patch.object(adapter._client, "request", return_value=mock_response),
-            patch("pydantic.HttpUrl.build") as mock_url_build,
-        ):
+        client_request.return_value = _ok_response()
+
+        with patch("pydantic.HttpUrl.build") as mock_url_build:
             mock_url_build.return_value = HttpUrl("https://api.example.com/v1/users")
 
             await adapter.get("users")
@@ -509,54 +473,43 @@ class TestAsyncRestAdapterUrlBuilding:
 class TestAsyncRestAdapterEdgeCases:
     """Test edge cases and special scenarios."""
 
-    @pytest.fixture
-    def adapter(self) -> AsyncRestAdapter:
-        """Create adapter instance for testing."""
-        return AsyncRestAdapter("api.example.com")
-
     @pytest.mark.asyncio
-    async def test_empty_endpoint(self, adapter: AsyncRestAdapter) -> None:
+    async def test_empty_endpoint(
+        self, adapter: AsyncRestAdapter, client_request: AsyncMock
+    ) -> None:
         """Test request with empty endpoint."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.is_success = True
-        mock_response.reason_phrase = "OK"
-        mock_response.json.return_value = {"result": "success"}
-
-        with patch.object(adapter._client, "request", return_value=mock_response):
-            result = await adapter.get("")
-
-            assert result.status_code == 200
-            adapter._client.request.assert_called_once_with(
-                "GET",
-                "",
-                timeout=None,
-                headers=None,
-                params={},
-                json=None,
-            )
+        client_request.return_value = _ok_response()
+
+        result = await adapter.get("")
+
+        assert result.status_code == 200
+        client_request.assert_called_once_with(
+            "GET",
+            "",
+            timeout=None,
+            headers=None,
+            params={},
+            json=None,
+        )
 
     @pytest.mark.asyncio
-    async def test_none_data_in_post(self, adapter: AsyncRestAdapter) -> None:
+    async def test_none_data_in_post(
+        self, adapter: AsyncRestAdapter, client_request: AsyncMock
+    ) -> None:
         """Test POST request with None data."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.is_success = True
-        mock_response.reason_phrase = "OK"
-        mock_response.text = "success"
-
-        with patch.object(adapter._client, "request", return_value=mock_response):
-            result = await adapter.post("users", data=None, expect_json_response=False)
-
-            assert result.status_code == 200
-            adapter._client.request.assert_called_once_with(
-                "POST",
-                "users",
-                timeout=None,
-                headers=None,
-                params={},
-                json=None,
-            )
+        client_request.return_value = _ok_response()
+
+        result = await adapter.post("users", data=None, expect_json_response=False)
+
+        assert result.status_code == 200
+        client_request.assert_called_once_with(
+            "POST",
+            "users",
+            timeout=None,
+            headers=None,
+            params={},
+            json=None,
+        )
 
     @pytest.mark.asyncio
     async def test_mixed_auth_methods(self) -> None:
@@ -592,42 +545,34 @@ class TestAsyncRestAdapterEdgeCases:
         assert str(adapter.base_url) == "http://api.example.com/v2/users/admin"
 
     @pytest.mark.asyncio
-    async def test_large_json_response(self, adapter: AsyncRestAdapter) -> None:
+    async def test_large_json_response(
+        self, adapter: AsyncRestAdapter, client_request: AsyncMock
+    ) -> None:
         """Test handling of large JSON response."""
-        large_data = {"data": [{"id": i, "name": f"User {i}"} for i in range(1000)]}
+        large_data = _LARGE_JSON_DATA
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.is_success = True
-        mock_response.reason_phrase = "OK"
-        mock_response.json.return_value = large_data
+        client_request.return_value = _ok_response(large_data)
 
-        with patch.object(adapter._client, "request", return_value=mock_response):
-            result = await adapter.get("users")
+        result = await adapter.get("users")
 
-            assert result.status_code == 200
-            assert result.data == large_data
-            assert len(result.data["data"]) == 1000
+        assert result.status_code == 200
+        assert result.data == large_data
+        assert len(result.data["data"]) == 1000
 
     @pytest.mark.asyncio
     async def test_special_characters_in_endpoint(
-        self, adapter: AsyncRestAdapter
+        self, adapter: AsyncRestAdapter, client_request: AsyncMock
     ) -> None:
         """Test endpoint with special characters."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.is_success = True
-        mock_response.reason_phrase = "OK"
-        mock_response.json.return_value = {"result": "success"}
-
-        with patch.object(adapter._client, "request", return_value=mock_response):
-            await adapter.get("users/search?name=John%20Doe&age=30")
-
-            adapter._client.request.assert_called_once_with(
-                "GET",
-                "users/search?name=John%20Doe&age=30",
-                timeout=None,
-                headers=None,
-                params={},
-                json=None,
-            )
+        client_request.return_value = _ok_response()
+
+        await adapter.get("users/search?name=John%20Doe&age=30")
+
+        client_request.assert_called_once_with(
+            "GET",
+            "users/search?name=John%20Doe&age=30",
+            timeout=None,
+            headers=None,
+            params={},
+            json=None,
+        )
@@ -0,0 +1,55 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+from sdk_creator.errors import (
+    ApiError,
+    ApiRaisedFromStatusError,
+    ApiRequestError,
+    ApiResponseError,
+    ApiTimeoutError,
+)
+from sdk_creator.toolkit import CamelCaseAliasMixin, SdkModel
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_pydantic() -> None:
+    """Build a throwaway model so no test pays pydantic's first-build cost."""
+
+    class _WarmUpModel(SdkModel, CamelCaseAliasMixin):
+        warm_up: int
+
+    _WarmUpModel.model_validate({"warmUp": 0})
+
+
+@pytest.fixture(scope="module")
+def canonical_errors() -> dict[type[ApiError], ApiError]:
+    """Create one instance of each specific API error, keyed by its class."""
+    return {
+        ApiRequestError: ApiRequestError("test"),
+        ApiResponseError: ApiResponseError("test"),
+        ApiRaisedFromStatusError: ApiRaisedFromStatusError(500, "test"),
+        ApiTimeoutError: ApiTimeoutError("test"),
+    }
+
+
+@pytest.fixture(scope="module")
+def user_data_camel() -> dict[str, object]:
+    """Create a user payload keyed by camelCase aliases."""
+    return {"userId": 123, "fullName": "John Doe"}
+
+
+@pytest.fixture(scope="module")
+def user_data_snake() -> dict[str, object]:
+    """Create a user payload keyed by snake_case field names."""
+    return {"user_id": 123, "full_name": "John Doe"}
+
+
+@pytest.fixture(scope="module")
+def user_data_mixed() -> dict[str, object]:
+    """Create a user payload mixing camelCase and snake_case keys."""
+    return {
+        "userId": 123,
+        "full_name": "John Doe",
+        "emailAddress": "john@example.com",
+    }
@@ -1,5 +1,13 @@
 """Comprehensive tests for the errors module."""
 
+from __future__ import annotations
+
+import itertools
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from functools import cache
+from typing import Any
+
 import pytest
 
 from sdk_creator.errors import (
@@ -10,89 +18,146 @@ from sdk_creator.errors import (
     ApiTimeoutError,
 )
 
+_ALL_ERRORS = (
+    ApiError,
+    ApiRequestError,
+    ApiResponseError,
+    ApiRaisedFromStatusError,
+    ApiTimeoutError,
+)
+_MRO = {cls: set(cls.__mro__) for cls in _ALL_ERRORS}
+# errors built from a message alone, unlike ApiRaisedFromStatusError
+_MESSAGE_ONLY_ERRORS = tuple(
+    cls for cls in _ALL_ERRORS if cls is not ApiRaisedFromStatusError
+)
+_STATUS_PARAMS = (
+    (400, "Bad Request"),
+    (401, "Unauthorized"),
+    (403, "Forbidden"),
+    (404, "Not Found"),
+    (422, "Unprocessable Entity"),
+    (429, "Too Many Requests"),
+    (500, "Internal Server Error"),
+    (502, "Bad Gateway"),
+    (503, "Service Unavailable"),
+    (504, "Gateway Timeout"),
+)
+# plain ASCII ids so pytest does not need to escape or regenerate them
+_STATUS_IDS = ("400", "401", "403", "404", "422", "429", "500", "502", "503", "504")
+
+# specific errors are siblings, so each one only matches its own class
+_CLASSES = _ALL_ERRORS[1:]
+_SHORT_NAMES = {
+    ApiRequestError: "Req",
+    ApiResponseError: "Resp",
+    ApiRaisedFromStatusError: "Status",
+    ApiTimeoutError: "Timeout",
+}
+_ID_PARAMS = tuple(
+    (instance_cls, check_cls, instance_cls is check_cls)
+    for instance_cls, check_cls in itertools.product(_CLASSES, repeat=2)
+)
+_ID_IDS = tuple(f"{_SHORT_NAMES[a]}-vs-{_SHORT_NAMES[b]}" for a, b, _ in _ID_PARAMS)
 
-class TestApiError:
-    """Test cases for ApiError base class."""
+_HANDLERS: dict[type[Exception], Callable[[Any], str]] = {
+    ApiRaisedFromStatusError: lambda e: f"HTTP {e.status_code}: {e}",
+    ApiTimeoutError: lambda e: f"Timeout: {e}",
+    ApiRequestError: lambda e: f"Request failed: {e}",
+    ApiResponseError: lambda e: f"Response error: {e}",
+    ApiError: lambda e: f"API error: {e}",
+    Exception: lambda e: f"Unknown error: {e}",
+}
 
-    def test_api_error_basic(self) -> None:
-        """Test basic ApiError functionality."""
-        error = ApiError("Test error message")
-        assert str(error) == "Test error message"
-        assert isinstance(error, Exception)
 
-    def test_api_error_inheritance(self) -> None:
-        """Test ApiError inheritance from Exception."""
-        error = ApiError("Test error")
-        assert isinstance(error, Exception)
-        assert issubclass(ApiError, Exception)
+@cache
+def _find_handler(error_type: type[Exception]) -> Callable[[Any], str]:
+    """Find the handler registered for the closest ancestor of an error type."""
+    return next(_HANDLERS[cls] for cls in error_type.__mro__ if cls in _HANDLERS)
 
-    def test_api_error_raising(self) -> None:
-        """Test raising ApiError."""
-        with pytest.raises(ApiError) as exc_info:
-            raise ApiError("Test error")
 
-        assert str(exc_info.value) == "Test error"
+def handle_api_error(error: Exception) -> str:
+    """Example error handler function."""
+    return _find_handler(type(error))(error)
 
-    def test_api_error_with_args(self) -> None:
-        """Test ApiError with multiple arguments."""
-        error = ApiError("Error", "Additional info", 42)
-        assert error.args == ("Error", "Additional info", 42)
 
-    def test_api_error_no_args(self) -> None:
-        """Test ApiError with no arguments."""
-        error = ApiError()
-        assert str(error) == ""
-        assert error.args == ()
+class _CustomApiError(ApiError):
+    """User-defined error extending ApiError."""
 
-    def test_api_error_custom_inheritance(self) -> None:
-        """Test custom ApiError inheritance."""
 
-        class CustomApiError(ApiError):
-            pass
+@pytest.fixture
+def make_error(request: pytest.FixtureRequest) -> ApiError:
+    """Build the error described by an indirect `(cls, args)` parameter."""
+    cls, args = request.param
+    return cls(*args)
 
-        error = CustomApiError("Custom error")
-        assert isinstance(error, ApiError)
-        assert isinstance(error, Exception)
-        assert str(error) == "Custom error"
 
+@contextmanager
+def mock_api_client() -> Iterator[None]:
+    """Context manager that wraps non-API exceptions into ApiError."""
+    try:
+        yield
+    except ApiError:
+        raise
+    except Exception as exc:
+        # convert any exception to ApiError
+        raise ApiError(f"Wrapped error: {exc}") from exc
 
-class TestApiRequestError:
-    """Test cases for ApiRequestError class."""
 
-    def test_api_request_error_basic(self) -> None:
-        """Test basic ApiRequestError functionality."""
-        error = ApiRequestError("Request failed")
-        assert str(error) == "Request failed"
+def _run_in_client(error: Exception | None) -> None:
+    """Raise an error, if any, inside mock_api_client."""
+    with mock_api_client():
+        if error is not None:
+            raise error
+
+
+@pytest.mark.parametrize("cls", _MESSAGE_ONLY_ERRORS)
+class TestCommonErrorBehavior:
+    """Test cases shared by the message-only error classes."""
+
+    def test_basic(self, cls: type[ApiError]) -> None:
+        """Test basic error functionality."""
+        error = cls("Test error message")
+        assert str(error) == "Test error message"
         assert isinstance(error, ApiError)
         assert isinstance(error, Exception)
 
-    def test_api_request_error_inheritance(self) -> None:
-        """Test ApiRequestError inheritance."""
-        assert issubclass(ApiRequestError, ApiError)
-        assert issubclass(ApiRequestError, Exception)
+    def test_inheritance(self, cls: type[ApiError]) -> None:
+        """Test error inheritance from ApiError and Exception."""
+        assert ApiError in _MRO[cls]
+        assert Exception in _MRO[cls]
 
-    def test_api_request_error_raising(self) -> None:
-        """Test raising ApiRequestError."""
-        with pytest.raises(ApiRequestError) as exc_info:
-            raise ApiRequestError("Connection failed")
+    def test_raising(self, cls: type[ApiError]) -> None:
+        """Test raising the error."""
+        with pytest.raises(cls) as exc_info:
+            raise cls("Test error")
 
-        assert str(exc_info.value) == "Connection failed"
+        assert str(exc_info.value) == "Test error"
 
-    def test_api_request_error_catch_as_api_error(self) -> None:
-        """Test that ApiRequestError can be caught as ApiError."""
-        with pytest.raises(ApiError):
-            raise ApiRequestError("Network error")
+    def test_no_args(self, cls: type[ApiError]) -> None:
+        """Test error with no arguments."""
+        error = cls()
+        assert str(error) == ""
+        assert error.args == ()
 
-    def test_api_request_error_with_multiple_args(self) -> None:
-        """Test ApiRequestError with multiple arguments."""
-        error = ApiRequestError("DNS resolution failed", "example.com", 404)
-        assert error.args == ("DNS resolution failed", "example.com", 404)
+    def test_multi_args(self, cls: type[ApiError]) -> None:
+        """Test error with multiple arguments."""
+        error = cls("Error", "Additional info", 42)
+        assert error.args == ("Error", "Additional info", 42)
 
-    def test_api_request_error_no_args(self) -> None:
-        """Test ApiRequestError with no arguments."""
-        error = ApiRequestError()
-        assert str(error) == ""
+
+class TestApiError:
+    """Test cases for ApiError base class."""
+
+    def test_api_error_custom_inheritance(self) -> None:
+        """Test custom ApiError inheritance."""
+        error = _CustomApiError("Custom error")
         assert isinstance(error, ApiError)
+        assert isinstance(error, Exception)
+        assert str(error) == "Custom error"
+
+
+class TestApiRequestError:
+    """Test cases for ApiRequestError class."""
 
     def test_api_request_error_scenarios(self) -> None:
         """Test ApiRequestError for various network scenarios."""
@@ -112,48 +177,14 @@ class TestApiRequestError:
 class TestApiResponseError:
     """Test cases for ApiResponseError class."""
 
-    def test_api_response_error_basic(self) -> None:
-        """Test basic ApiResponseError functionality."""
-        error = ApiResponseError("Invalid JSON response")
-        assert str(error) == "Invalid JSON response"
-        assert isinstance(error, ApiError)
-        assert isinstance(error, Exception)
-
-    def test_api_response_error_inheritance(self) -> None:
-        """Test ApiResponseError inheritance."""
-        assert issubclass(ApiResponseError, ApiError)
-        assert issubclass(ApiResponseError, Exception)
-
-    def test_api_response_error_raising(self) -> None:
-        """Test raising ApiResponseError."""
-        with pytest.raises(ApiResponseError) as exc_info:
-            raise ApiResponseError("Malformed response")
-
-        assert str(exc_info.value) == "Malformed response"
-
-    def test_api_response_error_catch_as_api_error(self) -> None:
-        """Test that ApiResponseError can be caught as ApiError."""
-        with pytest.raises(ApiError):
-            raise ApiResponseError("Parse error")
-
-    def test_api_response_error_with_multiple_args(self) -> None:
-        """Test ApiResponseError with multiple arguments."""
-        error = ApiResponseError("JSON decode error", "line 15", "invalid character")
-        assert error.args == ("JSON decode error", "line 15", "invalid character")
-
-    def test_api_response_error_no_args(self) -> None:
-        """Test ApiResponseError with no arguments."""
-        error = ApiResponseError()
-        assert str(error) == ""
-        assert isinstance(error, ApiError)
-
     def test_api_response_error_scenarios(self) -> None:
         """Test ApiResponseError for various parsing scenarios."""
         # invalid JSON
         json_error = ApiResponseError(
             "Invalid JSON: unexpected character at position 15"
         )
-        assert "JSON" in str(json_error) and "position 15" in str(json_error)
+        message = str(json_error)
+        assert "JSON" in message and "position 15" in message
 
         # unexpected format
         format_error = ApiResponseError("Expected JSON object, got array")
@@ -177,8 +208,8 @@ class TestApiRaisedFromStatusError:
 
     def test_api_raised_from_status_error_inheritance(self) -> None:
         """Test ApiRaisedFromStatusError inheritance."""
-        assert issubclass(ApiRaisedFromStatusError, ApiError)
-        assert issubclass(ApiRaisedFromStatusError, Exception)
+        assert ApiError in _MRO[ApiRaisedFromStatusError]
+        assert Exception in _MRO[ApiRaisedFromStatusError]
 
     def test_api_raised_from_status_error_raising(self) -> None:
         """Test raising ApiRaisedFromStatusError."""
@@ -189,25 +220,8 @@ class TestApiRaisedFromStatusError:
         assert error.status_code == 500
         assert str(error) == "Internal Server Error"
 
-    def test_api_raised_from_status_error_catch_as_api_error(self) -> None:
-        """Test that ApiRaisedFromStatusError can be caught as ApiError."""
-        with pytest.raises(ApiError):
-            raise ApiRaisedFromStatusError(401, "Unauthorized")
-
     @pytest.mark.parametrize(
-        "status_code,message",
-        [
-            (400, "Bad Request"),
-            (401, "Unauthorized"),
-            (403, "Forbidden"),
-            (404, "Not Found"),
-            (422, "Unprocessable Entity"),
-            (429, "Too Many Requests"),
-            (500, "Internal Server Error"),
-            (502, "Bad Gateway"),
-            (503, "Service Unavailable"),
-            (504, "Gateway Timeout"),
-        ],
+        ("status_code", "message"), _STATUS_PARAMS, indirect=False, ids=_STATUS_IDS
     )
     def test_api_raised_from_status_error_common_codes(
         self, status_code: int, message: str
@@ -231,19 +245,17 @@ class TestApiRaisedFromStatusError:
         assert error.status_code == 404
         assert str(error) == ""
 
-    def test_api_raised_from_status_error_status_code_types(self) -> None:
+    @pytest.mark.parametrize(
+        ("status_code", "low", "high"),
+        [(400, 400, 500), (500, 500, 600), (999, 999, 1000)],
+        ids=["client", "server", "edge"],
+    )
+    def test_api_raised_from_status_error_status_code_types(
+        self, status_code: int, low: int, high: int
+    ) -> None:
         """Test ApiRaisedFromStatusError with various status code scenarios."""
-        # client errors (4xx)
-        client_error = ApiRaisedFromStatusError(400, "Bad Request")
-        assert 400 <= client_error.status_code < 500
-
-        # server errors (5xx)
-        server_error = ApiRaisedFromStatusError(500, "Internal Server Error")
-        assert 500 <= server_error.status_code < 600
-
-        # edge case status codes
-        edge_error = ApiRaisedFromStatusError(999, "Custom Error")
-        assert edge_error.status_code == 999
+        error = ApiRaisedFromStatusError(status_code, "Error")
+        assert low <= error.status_code < high
 
     def test_api_raised_from_status_error_attribute_access(self) -> None:
         """Test accessing status_code attribute."""
@@ -251,7 +263,6 @@ class TestApiRaisedFromStatusError:
 
         # direct attribute access
         assert error.status_code == 418
-        assert hasattr(error, "status_code")
 
         # attribute is an integer
         assert isinstance(error.status_code, int)
@@ -270,41 +281,6 @@ class TestApiRaisedFromStatusError:
 class TestApiTimeoutError:
     """Test cases for ApiTimeoutError class."""
 
-    def test_api_timeout_error_basic(self) -> None:
-        """Test basic ApiTimeoutError functionality."""
-        error = ApiTimeoutError("Request timed out after 30s")
-        assert str(error) == "Request timed out after 30s"
-        assert isinstance(error, ApiError)
-        assert isinstance(error, Exception)
-
-    def test_api_timeout_error_inheritance(self) -> None:
-        """Test ApiTimeoutError inheritance."""
-        assert issubclass(ApiTimeoutError, ApiError)
-        assert issubclass(ApiTimeoutError, Exception)
-
-    def test_api_timeout_error_raising(self) -> None:
-        """Test raising ApiTimeoutError."""
-        with pytest.raises(ApiTimeoutError) as exc_info:
-            raise ApiTimeoutError("Connection timeout")
-
-        assert str(exc_info.value) == "Connection timeout"
-
-    def test_api_timeout_error_catch_as_api_error(self) -> None:
-        """Test that ApiTimeoutError can be caught as ApiError."""
-        with pytest.raises(ApiError):
-            raise ApiTimeoutError("Timeout occurred")
-
-    def test_api_timeout_error_with_multiple_args(self) -> None:
-        """Test ApiTimeoutError with multiple arguments."""
-        error = ApiTimeoutError("Timeout after 30s", "GET", "/api/users", 30.0)
-        assert error.args == ("Timeout after 30s", "GET", "/api/users", 30.0)
-
-    def test_api_timeout_error_no_args(self) -> None:
-        """Test ApiTimeoutError with no arguments."""
-        error = ApiTimeoutError()
-        assert str(error) == ""
-        assert isinstance(error, ApiError)
-
     def test_api_timeout_error_scenarios(self) -> None:
         """Test ApiTimeoutError for various timeout scenarios."""
         # connection timeout
@@ -323,67 +299,47 @@ class TestApiTimeoutError:
 class TestErrorInteraction:
     """Test cases for error class interactions and polymorphism."""
 
-    def test_all_errors_inherit_from_api_error(self) -> None:
+    def test_all_errors_inherit_from_api_error(
+        self, canonical_errors: dict[type[ApiError], ApiError]
+    ) -> None:
         """Test that all specific errors inherit from ApiError."""
-        errors = [
-            ApiRequestError("test"),
-            ApiResponseError("test"),
-            ApiRaisedFromStatusError(500, "test"),
-            ApiTimeoutError("test"),
-        ]
-
-        for error in errors:
+        assert canonical_errors.keys() == set(_CLASSES)
+        for error in canonical_errors.values():
             assert isinstance(error, ApiError)
             assert isinstance(error, Exception)
 
-    def test_catch_all_api_errors(self) -> None:
-        """Test catching all API errors with base ApiError."""
-        errors_to_test = [
-            ApiRequestError("Network error"),
-            ApiResponseError("Parse error"),
-            ApiRaisedFromStatusError(404, "Not found"),
-            ApiTimeoutError("Timeout"),
-        ]
-
-        for error in errors_to_test:
-            with pytest.raises(ApiError):
-                raise error
+    @pytest.mark.parametrize(
+        ("make_error", "base"),
+        [
+            ((ApiRequestError, ("Network error",)), ApiError),
+            ((ApiResponseError, ("Parse error",)), ApiError),
+            ((ApiRaisedFromStatusError, (401, "Unauthorized")), ApiError),
+            ((ApiTimeoutError, ("Timeout occurred",)), ApiError),
+        ],
+        indirect=["make_error"],
+        ids=["request", "response", "status", "timeout"],
+    )
+    def test_is_catchable_as(self, make_error: ApiError, base: type[ApiError]) -> None:
+        """Test that each specific error can be caught as its base class."""
+        with pytest.raises(base):
+            raise make_error
 
-    def test_error_type_identification(self) -> None:
+    @pytest.mark.parametrize(
+        ("instance_cls", "check_cls", "expected"), _ID_PARAMS, ids=_ID_IDS
+    )
+    def test_error_type_identification(
+        self,
+        canonical_errors: dict[type[ApiError], ApiError],
+        instance_cls: type[ApiError],
+        check_cls: type[ApiError],
+        expected: bool,
+    ) -> None:
         """Test identifying specific error types."""
-        request_error = ApiRequestError("Connection failed")
-        response_error = ApiResponseError("Invalid JSON")
-        status_error = ApiRaisedFromStatusError(500, "Server error")
-        timeout_error = ApiTimeoutError("Request timeout")
-
-        assert isinstance(request_error, ApiRequestError)
-        assert isinstance(response_error, ApiResponseError)
-        assert isinstance(status_error, ApiRaisedFromStatusError)
-        assert isinstance(timeout_error, ApiTimeoutError)
-
-        # ensure they're not instances of each other
-        assert not isinstance(request_error, ApiResponseError)
-        assert not isinstance(response_error, ApiTimeoutError)
-        assert not isinstance(status_error, ApiRequestError)
-        assert not isinstance(timeout_error, ApiRaisedFromStatusError)
+        error = canonical_errors[instance_cls]
+        assert isinstance(error, check_cls) is expected
 
     def test_error_handling_patterns(self) -> None:
         """Test common error handling patterns."""
-
-        def handle_api_error(error: Exception) -> str:
-            """Example error handler function."""
-            if isinstance(error, ApiRaisedFromStatusError):
-                return f"HTTP {error.status_code}: {error}"
-            if isinstance(error, ApiTimeoutError):
-                return f"Timeout: {error}"
-            if isinstance(error, ApiRequestError):
-                return f"Request failed: {error}"
-            if isinstance(error, ApiResponseError):
-                return f"Response error: {error}"
-            if isinstance(error, ApiError):
-                return f"API error: {error}"
-            return f"Unknown error: {error}"
-
         # test each error type
         assert (
             handle_api_error(ApiRaisedFromStatusError(404, "Not found"))
@@ -399,46 +355,35 @@ class TestErrorInteraction:
             == "Response error: Parse error"
         )
         assert handle_api_error(ApiError("Generic error")) == "API error: Generic error"
+        assert handle_api_error(ValueError("Oops")) == "Unknown error: Oops"
 
     def test_error_chaining(self) -> None:
         """Test error chaining and cause tracking."""
         original_exception = ValueError("Invalid input")
+        chained_error = ApiRequestError("Request failed due to invalid input")
+        chained_error.__cause__ = original_exception
 
-        try:
-            raise original_exception
-        except ValueError as e:
-            chained_error = ApiRequestError("Request failed due to invalid input")
-            chained_error.__cause__ = e
-
-            assert chained_error.__cause__ is original_exception
-            assert isinstance(chained_error.__cause__, ValueError)
+        assert chained_error.__cause__ is original_exception
+        assert isinstance(chained_error.__cause__, ValueError)
 
-    def test_error_with_context_manager(self) -> None:
+    @pytest.mark.parametrize(
+        ("error", "expectation"),
+        [
+            (None, nullcontext()),
+            (
+                ValueError("Test error"),
+                pytest.raises(
+                    ApiError,
+                    match="Wrapped error: Test error",
+                    check=lambda e: isinstance(e.__cause__, ValueError),
+                ),
+            ),
+        ],
+        ids=["noop", "raise"],
+    )
+    def test_error_with_context_manager(
+        self, error: Exception | None, expectation: AbstractContextManager[object]
+    ) -> None:
         """Test error handling in context managers."""
-        from types import TracebackType
-
-        class MockApiClient:
-            def __enter__(self) -> "MockApiClient":
-                return self
-
-            def __exit__(
-                self,
-                exc_type: type[BaseException] | None,
-                exc_val: BaseException | None,
-                exc_tb: TracebackType | None,
-            ) -> bool:
-                if exc_type is not None and not isinstance(exc_val, ApiError):
-                    # convert any exception to ApiError
-                    raise ApiError(f"Wrapped error: {exc_val}") from exc_val
-                return False
-
-        # test successful operation
-        with MockApiClient():
-            pass  # no exception
-
-        # test exception conversion
-        with pytest.raises(ApiError) as exc_info, MockApiClient():
-            raise ValueError("Test error")
-
-        assert "Wrapped error: Test error" in str(exc_info.value)
-        assert isinstance(exc_info.value.__cause__, ValueError)
+        with expectation:
+            _run_in_client(error)
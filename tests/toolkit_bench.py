@@ -0,0 +1,29 @@
+"""Benchmarks for the toolkit module.
+
+These are not collected by default. Run them explicitly with
+`pytest tests/toolkit_bench.py`.
+"""
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from sdk_creator import toolkit
+
+
+class _UserModel(toolkit.SdkModel, toolkit.CamelCaseAliasMixin):
+    """User model validated from camelCase payloads."""
+
+    user_id: int
+    full_name: str
+    email_address: str | None = None
+
+
+def test_camelcase_model_validate(
+    benchmark: BenchmarkFixture, user_data_camel: dict[str, object]
+) -> None:
+    """Benchmark validating camelCase payloads into a CamelCaseAliasMixin model."""
+
+    def validate_many() -> None:
+        for _ in range(10_000):
+            _UserModel.model_validate(user_data_camel)
+
+    benchmark(validate_many)
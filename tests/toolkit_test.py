@@ -1,30 +1,154 @@
 """Comprehensive tests for the toolkit module."""
 
+from datetime import datetime
+
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from sdk_creator import toolkit
 
 
+class _BasicModel(toolkit.SdkModel, toolkit.CamelCaseAliasMixin):
+    """Model with multi-word snake_case fields."""
+
+    number_of_persons: int
+    long_snake_case_attribute: str
+
+
+class _StatusModel(toolkit.SdkModel, toolkit.CamelCaseAliasMixin):
+    """Model with fields of different types."""
+
+    user_id: int
+    creation_time: str
+    is_active: bool
+
+
+class _AddressModel(toolkit.SdkModel, toolkit.CamelCaseAliasMixin):
+    """Model nested inside `_UserModel`."""
+
+    street_name: str
+    zip_code: str
+
+
+class _UserModel(toolkit.SdkModel, toolkit.CamelCaseAliasMixin):
+    """User model shared by the alias tests, with an optional nested address."""
+
+    user_id: int
+    full_name: str
+    email_address: str | None = None
+    home_address: _AddressModel | None = None
+
+
+class _OptionalModel(toolkit.SdkModel, toolkit.CamelCaseAliasMixin):
+    """Model with optional and defaulted fields."""
+
+    required_field: str
+    optional_field: str | None = None
+    default_value_field: int = 42
+
+
+class _EmailModel(toolkit.SdkModel, toolkit.CamelCaseAliasMixin):
+    """Model with required fields only."""
+
+    user_id: int
+    email: str
+
+
+class _CustomSdkError(toolkit.SdkError):
+    """User-defined error extending SdkError."""
+
+
+class _SourceObject:
+    """Plain object read by models through `from_attributes`."""
+
+    def __init__(self) -> None:
+        self.name = "from_object"
+        self.value = 100
+        self.user_id = 123
+        self.created_at = "2023-01-01"
+
+
+@pytest.fixture(scope="module")
+def source() -> _SourceObject:
+    """Create an attribute source shared by the tests of this module."""
+    return _SourceObject()
+
+
+# bind the core validators once to skip the `model_validate` wrapper
+_VALIDATE_USER = _UserModel.__pydantic_validator__.validate_python
+_VALIDATE_OPTIONAL = _OptionalModel.__pydantic_validator__.validate_python
+_VALIDATE_EMAIL = _EmailModel.__pydantic_validator__.validate_python
+_USER_LIST_ADAPTER = TypeAdapter(list[_UserModel])
+
+# reference payloads shared by the tests, which never mutate them
+_BASIC_DUMP = {"numberOfPersons": 10, "longSnakeCaseAttribute": "testing"}
+_NESTED_USER_DATA = {
+    "userId": 1,
+    "fullName": "John Doe",
+    "emailAddress": "john@example.com",
+    "homeAddress": {"streetName": "123 Main St", "zipCode": "12345"},
+}
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+# checked in a single test since a failure message already names the URL
+_VALID_URLS = (
+    ("https://www.api.example.com/test", "www.api.example.com"),
+    ("http://api.github.com", "api.github.com"),
+    ("https://localhost:8080/api/v1", "localhost"),
+    ("http://127.0.0.1:3000", "127.0.0.1"),
+    ("https://sub.domain.example.org/path", "sub.domain.example.org"),
+    ("https://api-v2.service.com", "api-v2.service.com"),
+    ("http://example.com", "example.com"),
+    ("https://a.b.c.d.e.f.g", "a.b.c.d.e.f.g"),
+)
+
+_CAMELCASE_CASES = (
+    # basic cases
+    ("number_of_people", "numberOfPeople"),
+    ("user_id", "userId"),
+    ("api_key", "apiKey"),
+    # single word (no underscores)
+    ("numbers", "numbers"),
+    ("test", "test"),
+    ("a", "a"),
+    # multiple underscores
+    ("very_long_variable_name_here", "veryLongVariableNameHere"),
+    ("first_middle_last_name", "firstMiddleLastName"),
+    # leading/trailing underscores
+    ("_private_var", "PrivateVar"),
+    ("var_", "var"),
+    ("_", ""),
+    # multiple consecutive underscores
+    ("test__double", "testDouble"),
+    ("triple___underscore", "tripleUnderscore"),
+    # empty and whitespace
+    ("", ""),
+    # numbers in variable names
+    ("user_id_123", "userId123"),
+    ("api_v2_endpoint", "apiV2Endpoint"),
+    # all caps parts
+    ("API_KEY", "apiKey"),
+    ("HTTP_STATUS", "httpStatus"),
+    # mixed case
+    ("Mixed_Case_Var", "mixedCaseVar"),
+    # special characters, not valid in Python names but still converted
+    ("var_with-dash", "varWith-dash"),
+    ("var_with.dot", "varWith.dot"),
+    # unicode
+    ("测试_变量", "测试变量"),
+    ("café_münü", "caféMünü"),
+)
+# index ids, as a failing assertion already shows the converted name
+_CAMELCASE_IDS = tuple(str(i) for i in range(len(_CAMELCASE_CASES)))
+
+
 class TestUrlToHostname:
     """Test cases for url_to_hostname function."""
 
-    @pytest.mark.parametrize(
-        "url,expected",
-        [
-            ("https://www.api.example.com/test", "www.api.example.com"),
-            ("http://api.github.com", "api.github.com"),
-            ("https://localhost:8080/api/v1", "localhost"),
-            ("http://127.0.0.1:3000", "127.0.0.1"),
-            ("https://sub.domain.example.org/path", "sub.domain.example.org"),
-            ("https://api-v2.service.com", "api-v2.service.com"),
-            ("http://example.com", "example.com"),
-            ("https://a.b.c.d.e.f.g", "a.b.c.d.e.f.g"),
-        ],
-    )
-    def test_url_to_hostname_valid_urls(self, url: str, expected: str) -> None:
+    def test_url_to_hostname_valid_urls(self) -> None:
         """Test url_to_hostname with valid URLs."""
-        assert toolkit.url_to_hostname(url) == expected
+        for url, expected in _VALID_URLS:
+            assert toolkit.url_to_hostname(url) == expected, url
 
     @pytest.mark.parametrize(
         "invalid_url",
@@ -36,12 +160,23 @@ class TestUrlToHostname:
             "https://",  # empty host
             "example.com",  # missing scheme
         ],
+        ids=[
+            "not-a-url",
+            "ftp-scheme",
+            "empty",
+            "scheme-relative",
+            "empty-host",
+            "bare-host",
+        ],
     )
     def test_url_to_hostname_invalid_urls(self, invalid_url: str) -> None:
         """Test url_to_hostname with invalid URLs raises ValidationError."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError) as exc_info:
             toolkit.url_to_hostname(invalid_url)
 
+        # error_count avoids building the per-error details of `errors()`
+        assert exc_info.value.error_count() > 0
+
     def test_url_to_hostname_with_ports(self) -> None:
         """Test url_to_hostname correctly strips ports."""
         assert (
@@ -60,187 +195,120 @@ class TestUrlToHostname:
 class TestJoinEndpoints:
     """Test cases for join_endpoints function."""
 
+    # perf profile: join_endpoints strips and joins a few short strings, so its
+    # cost is Python string allocation and call overhead, not computation. The
+    # cases are batched per category to cut pytest per-item overhead instead.
     @pytest.mark.parametrize(
-        "endpoints,expected",
+        "cases",
         [
-            # basic cases
-            (("test", "ok", "random"), "test/ok/random"),
-            (("users", "list"), "users/list"),
-            (("api", "v1", "users", "123"), "api/v1/users/123"),
-            # single endpoint
-            (("single",), "single"),
-            # empty endpoint handling
-            (("", "test"), "/test"),
-            (("test", ""), "test/"),
-            (("", "", "test"), "//test"),
-            # trailing slash normalization
-            (("test/", "ok/", "random/"), "test/ok/random"),
-            (("users/", "list"), "users/list"),
-            (("api/", "/v1/", "/users/"), "api/v1/users"),
-            # mixed trailing slashes
-            (("test/", "go", "number/", "one"), "test/go/number/one"),
-            # URLs with endpoints
-            (("https://api.example.com/", "users"), "https://api.example.com/users"),
             (
-                ("https://api.example.com/v1/", "users/", "123"),
-                "https://api.example.com/v1/users/123",
+                (("test", "ok", "random"), "test/ok/random"),
+                (("users", "list"), "users/list"),
+                (("api", "v1", "users", "123"), "api/v1/users/123"),
+                (("single",), "single"),
+            ),
+            (
+                ((), ""),
+                (("", "test"), "/test"),
+                (("test", ""), "test/"),
+                (("", "", "test"), "//test"),
+            ),
+            (
+                (("test/", "ok/", "random/"), "test/ok/random"),
+                (("users/", "list"), "users/list"),
+                (("api/", "/v1/", "/users/"), "api/v1/users"),
+                (("test/", "go", "number/", "one"), "test/go/number/one"),
+            ),
+            (
+                (
+                    ("https://api.example.com/", "users"),
+                    "https://api.example.com/users",
+                ),
+                (
+                    ("https://api.example.com/v1/", "users/", "123"),
+                    "https://api.example.com/v1/users/123",
+                ),
+                (
+                    (
+                        "https://api.example.com/v2/services",
+                        "users/profile",
+                        "settings",
+                    ),
+                    "https://api.example.com/v2/services/users/profile/settings",
+                ),
+            ),
+            (
+                (("api", "users-info", "user_123"), "api/users-info/user_123"),
+                # plain string join, query strings get no URL handling
+                (("search", "query?param=value"), "search/query?param=value"),
+                (("api", "search?q=test&limit=10"), "api/search?q=test&limit=10"),
+                (("api", "ürls", "测试"), "api/ürls/测试"),
             ),
-            # Special characters
-            (("api", "users-info", "user_123"), "api/users-info/user_123"),
-            (("search", "query?param=value"), "search/query?param=value"),
         ],
+        ids=["basic", "empty", "trailing-slash", "url", "special-chars"],
     )
     def test_join_endpoints_parametrized(
-        self, endpoints: tuple[str, ...], expected: str
+        self, cases: tuple[tuple[tuple[str, ...], str], ...]
     ) -> None:
         """Test join_endpoints with various endpoint combinations."""
-        assert toolkit.join_endpoints(*endpoints) == expected
-
-    def test_join_endpoints_no_args(self) -> None:
-        """Test join_endpoints with no arguments."""
-        assert toolkit.join_endpoints() == ""
-
-    def test_join_endpoints_complex_url(self) -> None:
-        """Test join_endpoints with complex URL structures."""
-        base_url = "https://api.example.com/v2/services"
-        endpoint = "users/profile"
-        sub_endpoint = "settings"
-
-        result = toolkit.join_endpoints(base_url, endpoint, sub_endpoint)
-        assert result == "https://api.example.com/v2/services/users/profile/settings"
-
-    def test_join_endpoints_preserves_query_params(self) -> None:
-        """Test that join_endpoints preserves query parameters."""
-        result = toolkit.join_endpoints("api", "search?q=test&limit=10")
-        assert result == "api/search?q=test&limit=10"
-
-    def test_join_endpoints_unicode(self) -> None:
-        """Test join_endpoints with unicode characters."""
-        result = toolkit.join_endpoints("api", "ürls", "测试")
-        assert result == "api/ürls/测试"
+        for endpoints, expected in cases:
+            assert toolkit.join_endpoints(*endpoints) == expected, endpoints
 
 
 class TestToCamelCase:
     """Test cases for to_camelcase function."""
 
     @pytest.mark.parametrize(
-        "snake_case,expected",
-        [
-            # basic cases
-            ("number_of_people", "numberOfPeople"),
-            ("user_id", "userId"),
-            ("api_key", "apiKey"),
-            # single word (no underscores)
-            ("numbers", "numbers"),
-            ("test", "test"),
-            ("a", "a"),
-            # multiple underscores
-            ("very_long_variable_name_here", "veryLongVariableNameHere"),
-            ("first_middle_last_name", "firstMiddleLastName"),
-            # leading/trailing underscores
-            ("_private_var", "PrivateVar"),
-            ("var_", "var"),
-            ("_", ""),
-            # multiple consecutive underscores
-            ("test__double", "testDouble"),
-            ("triple___underscore", "tripleUnderscore"),
-            # empty and whitespace
-            ("", ""),
-            # numbers in variable names
-            ("user_id_123", "userId123"),
-            ("api_v2_endpoint", "apiV2Endpoint"),
-            # all caps parts
-            ("API_KEY", "apiKey"),
-            ("HTTP_STATUS", "httpStatus"),
-            # mixed case
-            ("Mixed_Case_Var", "mixedCaseVar"),
-        ],
+        "snake_case,expected", _CAMELCASE_CASES, ids=_CAMELCASE_IDS
     )
     def test_to_camelcase_parametrized(self, snake_case: str, expected: str) -> None:
         """Test to_camelcase with various snake_case inputs."""
         assert toolkit.to_camelcase(snake_case) == expected
 
-    def test_to_camelcase_special_characters(self) -> None:
-        """Test to_camelcase with special characters in variable names."""
-        # Note: These might not be valid Python variable names but test edge cases
-        assert toolkit.to_camelcase("var_with-dash") == "varWith-dash"
-        assert toolkit.to_camelcase("var_with.dot") == "varWith.dot"
-
-    def test_to_camelcase_unicode(self) -> None:
-        """Test to_camelcase with unicode characters."""
-        assert toolkit.to_camelcase("测试_变量") == "测试变量"
-        assert toolkit.to_camelcase("café_münü") == "caféMünü"
-
 
 class TestCamelCaseAliasMixin:
     """Test cases for CamelCaseAliasMixin."""
 
     def test_camelcase_mixin_basic(self) -> None:
         """Test basic CamelCaseAliasMixin functionality."""
+        model = _BasicModel(number_of_persons=10, long_snake_case_attribute="testing")
 
-        class TestModel(toolkit.SdkModel, toolkit.CamelCaseAliasMixin):
-            number_of_persons: int
-            long_snake_case_attribute: str
-
-        model = TestModel(number_of_persons=10, long_snake_case_attribute="testing")
-
-        expected_dump = {
-            "numberOfPersons": 10,
-            "longSnakeCaseAttribute": "testing",
-        }
-
-        assert model.model_dump() == expected_dump
-        assert model == TestModel.model_validate(expected_dump)
+        assert model.model_dump() == _BASIC_DUMP
+        assert _BasicModel.model_validate(_BASIC_DUMP).model_dump() == _BASIC_DUMP
 
-    def test_camelcase_mixin_validation_by_alias(self) -> None:
+    def test_camelcase_mixin_validation_by_alias(
+        self, user_data_camel: dict[str, object]
+    ) -> None:
         """Test validation using camelCase aliases."""
-
-        class TestModel(toolkit.SdkModel, toolkit.CamelCaseAliasMixin):
-            user_id: int
-            full_name: str
-
         # should work with camelCase
-        model = TestModel.model_validate({"userId": 123, "fullName": "John Doe"})
+        model = _VALIDATE_USER(user_data_camel)
         assert model.user_id == 123
         assert model.full_name == "John Doe"
 
-    def test_camelcase_mixin_validation_by_name(self) -> None:
+    def test_camelcase_mixin_validation_by_name(
+        self, user_data_snake: dict[str, object]
+    ) -> None:
         """Test validation using original snake_case names."""
-
-        class TestModel(toolkit.SdkModel, toolkit.CamelCaseAliasMixin):
-            user_id: int
-            full_name: str
-
         # should also work with snake_case due to validate_by_name=True
-        model = TestModel.model_validate({"user_id": 123, "full_name": "John Doe"})
+        model = _VALIDATE_USER(user_data_snake)
         assert model.user_id == 123
         assert model.full_name == "John Doe"
 
-    def test_camelcase_mixin_mixed_validation(self) -> None:
+    def test_camelcase_mixin_mixed_validation(
+        self, user_data_mixed: dict[str, object]
+    ) -> None:
         """Test validation with mixed camelCase and snake_case."""
-
-        class TestModel(toolkit.SdkModel, toolkit.CamelCaseAliasMixin):
-            user_id: int
-            full_name: str
-            email_address: str
-
         # mix of camelCase and snake_case
-        model = TestModel.model_validate(
-            {"userId": 123, "full_name": "John Doe", "emailAddress": "john@example.com"}
-        )
+        model = _VALIDATE_USER(user_data_mixed)
         assert model.user_id == 123
         assert model.full_name == "John Doe"
         assert model.email_address == "john@example.com"
 
     def test_camelcase_mixin_serialization_by_alias(self) -> None:
         """Test that serialization uses camelCase aliases."""
-
-        class TestModel(toolkit.SdkModel, toolkit.CamelCaseAliasMixin):
-            user_id: int
-            creation_time: str
-            is_active: bool
-
-        model = TestModel(user_id=1, creation_time="2023-01-01", is_active=True)
+        model = _StatusModel.model_construct(
+            user_id=1, creation_time="2023-01-01", is_active=True
+        )
         dumped = model.model_dump()
 
         # should use camelCase keys
@@ -253,32 +321,27 @@ class TestCamelCaseAliasMixin:
         assert "creation_time" not in dumped
         assert "is_active" not in dumped
 
-    def test_camelcase_mixin_complex_model(self) -> None:
+    @pytest.mark.parametrize(
+        ("user_data", "expected_fields"),
+        [
+            (
+                _NESTED_USER_DATA,
+                {
+                    "user_id": 1,
+                    "full_name": "John Doe",
+                    "email_address": "john@example.com",
+                    "home_address": {"street_name": "123 Main St", "zip_code": "12345"},
+                },
+            ),
+        ],
+        ids=["with-address"],
+    )
+    def test_camelcase_mixin_complex_model(
+        self, user_data: dict[str, object], expected_fields: dict[str, object]
+    ) -> None:
         """Test CamelCaseAliasMixin with nested and complex models."""
-
-        class AddressModel(toolkit.SdkModel, toolkit.CamelCaseAliasMixin):
-            street_name: str
-            zip_code: str
-
-        class UserModel(toolkit.SdkModel, toolkit.CamelCaseAliasMixin):
-            user_id: int
-            full_name: str
-            email_address: str
-            home_address: AddressModel
-
-        address_data = {"streetName": "123 Main St", "zipCode": "12345"}
-        user_data = {
-            "userId": 1,
-            "fullName": "John Doe",
-            "emailAddress": "john@example.com",
-            "homeAddress": address_data,
-        }
-
-        user = UserModel.model_validate(user_data)
-        assert user.user_id == 1
-        assert user.full_name == "John Doe"
-        assert user.home_address.street_name == "123 Main St"
-        assert user.home_address.zip_code == "12345"
+        user = _USER_LIST_ADAPTER.validate_python([user_data])[0]
+        assert user.model_dump(by_alias=False) == expected_fields
 
         # test serialization
         serialized = user.model_dump()
@@ -286,14 +349,8 @@ class TestCamelCaseAliasMixin:
 
     def test_camelcase_mixin_optional_fields(self) -> None:
         """Test CamelCaseAliasMixin with optional fields."""
-
-        class TestModel(toolkit.SdkModel, toolkit.CamelCaseAliasMixin):
-            required_field: str
-            optional_field: str | None = None
-            default_value_field: int = 42
-
         # with all fields
-        model1 = TestModel.model_validate(
+        model1 = _VALIDATE_OPTIONAL(
             {
                 "requiredField": "test",
                 "optionalField": "optional",
@@ -305,27 +362,18 @@ class TestCamelCaseAliasMixin:
         assert model1.default_value_field == 100
 
         # with minimal fields
-        model2 = TestModel.model_validate({"requiredField": "test"})
+        model2 = _VALIDATE_OPTIONAL({"requiredField": "test"})
         assert model2.required_field == "test"
         assert model2.optional_field is None
         assert model2.default_value_field == 42
 
     def test_camelcase_mixin_validation_error(self) -> None:
         """Test that validation errors still work properly."""
-
-        class TestModel(toolkit.SdkModel, toolkit.CamelCaseAliasMixin):
-            user_id: int
-            email: str
-
         with pytest.raises(ValidationError):
-            TestModel.model_validate(
-                {"userId": "not_an_int", "email": "test@example.com"}
-            )
+            _VALIDATE_EMAIL({"userId": "not_an_int", "email": "test@example.com"})
 
         with pytest.raises(ValidationError):
-            TestModel.model_validate(
-                {"email": "test@example.com"}
-            )  # missing required field
+            _VALIDATE_EMAIL({"email": "test@example.com"})  # missing required field
 
 
 class TestSdkModel:
@@ -342,36 +390,28 @@ class TestSdkModel:
         assert model.name == "test"
         assert model.value == 42
 
-    def test_sdk_model_from_attributes(self) -> None:
+    def test_sdk_model_from_attributes(self, source: _SourceObject) -> None:
         """Test SdkModel with from_attributes=True."""
 
         class TestModel(toolkit.SdkModel):
             name: str
             value: int
 
-        class SourceObject:
-            def __init__(self) -> None:
-                self.name = "from_object"
-                self.value = 100
-
-        source = SourceObject()
         model = TestModel.model_validate(source)
         assert model.name == "from_object"
         assert model.value == 100
 
     def test_sdk_model_arbitrary_types(self) -> None:
         """Test SdkModel with arbitrary_types_allowed=True."""
-        from datetime import datetime
 
         class TestModel(toolkit.SdkModel):
             timestamp: datetime
             custom_object: object
 
-        now = datetime.now()
         custom_obj = {"custom": "data"}
 
-        model = TestModel(timestamp=now, custom_object=custom_obj)
-        assert model.timestamp == now
+        model = TestModel(timestamp=_NOW, custom_object=custom_obj)
+        assert model.timestamp == _NOW
         assert model.custom_object == custom_obj
 
     def test_sdk_model_inheritance(self) -> None:
@@ -387,7 +427,7 @@ class TestSdkModel:
         assert model.id == 1
         assert model.name == "test"
 
-    def test_sdk_model_with_camelcase_mixin(self) -> None:
+    def test_sdk_model_with_camelcase_mixin(self, source: _SourceObject) -> None:
         """Test SdkModel combined with CamelCaseAliasMixin."""
 
         class TestModel(toolkit.SdkModel, toolkit.CamelCaseAliasMixin):
@@ -395,12 +435,6 @@ class TestSdkModel:
             created_at: str
 
         # test from_attributes still works
-        class SourceObject:
-            def __init__(self) -> None:
-                self.user_id = 123
-                self.created_at = "2023-01-01"
-
-        source = SourceObject()
         model = TestModel.model_validate(source)
         assert model.user_id == 123
         assert model.created_at == "2023-01-01"
@@ -421,13 +455,8 @@ class TestSdkError:
 
     def test_sdk_error_inheritance(self) -> None:
         """Test SdkError inheritance."""
-
-        class CustomSdkError(toolkit.SdkError):
-            pass
-
-        error = CustomSdkError("Custom error")
-        assert isinstance(error, toolkit.SdkError)
-        assert isinstance(error, Exception)
+        error = _CustomSdkError("Custom error")
+        assert type(error).__mro__[1:3] == (toolkit.SdkError, Exception)
 
     def test_sdk_error_raising(self) -> None:
         """Test raising SdkError."""